@@ -95,8 +95,12 @@ const List<Pokemon> allPokemon = [
   Pokemon(name: 'Mew', image: '$base/151.png', type: "Psychic", skills: ["Aura Sphere"]),
 ];
 
-Pokemon? findPokemon(String name) =>
-    allPokemon.firstWhereOrNull((p) => p.name.toLowerCase() == name.toLowerCase());
+// ค้นหาด้วยชื่อตัวพิมพ์เล็ก แทนการไล่ทั้งลิสต์ทุกครั้ง
+final Map<String, Pokemon> _pokemonByName = {
+  for (final p in allPokemon) p.name.toLowerCase(): p,
+};
+
+Pokemon? findPokemon(String name) => _pokemonByName[name.toLowerCase()];
 
 /* =======================
    Type chart (ย่อ) + สี
@@ -121,13 +125,18 @@ const Map<String, List<String>> typeAdvantages = {
   "Normal": [],
 };
 
-List<String> weaknessesOf(String t) {
-  final losers = <String>[];
+// ตารางจุดอ่อน (กลับด้านจาก typeAdvantages) สร้างครั้งเดียว
+final Map<String, List<String>> _weaknessTable = () {
+  final table = <String, List<String>>{};
   typeAdvantages.forEach((attacker, losersList) {
-    if (losersList.contains(t)) losers.add(attacker);
+    for (final t in losersList) {
+      (table[t] ??= <String>[]).add(attacker);
+    }
   });
-  return losers;
-}
+  return table.map((t, l) => MapEntry(t, List<String>.unmodifiable(l)));
+}();
+
+List<String> weaknessesOf(String t) => _weaknessTable[t] ?? const [];
 
 Color typeColor(String t, BuildContext ctx) {
   switch (t) {
@@ -214,6 +223,22 @@ class PresetsController extends GetxController {
         .toList();
   }
 
+  @override
+  void onReady() {
+    super.onReady();
+    _warmImages();
+  }
+
+  // โหลดรูปสมาชิกของทีมที่บันทึกไว้ล่วงหน้า (ไม่ต้องรอ) ให้หน้าทีมแสดงรูปได้ทันที
+  void _warmImages() {
+    final ctx = Get.context;
+    if (ctx == null) return;
+    final names = presets.expand((p) => p.memberNames).toSet();
+    for (final p in names.map(findPokemon).whereType<Pokemon>()) {
+      precacheImage(NetworkImage(p.image), ctx);
+    }
+  }
+
   void _persist() => _box.write(key, presets.map((p) => p.toJson()).toList());
 
   void addPreset(TeamPreset p) {
@@ -317,10 +342,11 @@ class PokemonListPage extends StatelessWidget {
               separatorBuilder: (_, __) => const Divider(height: 1),
               itemBuilder: (context, i) {
                 final p = allPokemon[i];
+                // ไม่ขึ้นกับทีม คำนวณครั้งเดียวนอก Obx
+                final weaknesses = weaknessesOf(p.type);
                 return Obx(() {
                   final inTeam = team.team.contains(p);
                   final disabled = inTeam || team.team.length >= 3;
-                  final weaknesses = weaknessesOf(p.type);
                   return ListTile(
                     leading: ClipRRect(
                       borderRadius: BorderRadius.circular(8),